@@ -20,25 +20,26 @@ H0_lcdm, Om_lcdm = 73.00, 0.302
 sigma8_lcdm_hoje = 0.81
 
 # --- MOTORES DE FÍSICA ---
-def H_modificado(a, H0, Om, R0, n):
-    z = (1.0 / a) - 1.0
-    termo_de = (1 - Om - R0) + R0 * (1 + z)**n
-    return H0 * np.sqrt(np.maximum(0, Om * (1 + z)**3 + termo_de))
+# H(a) e dH/da analíticos: E²(a) = Om·a⁻³ + ... e dH/da = H0²·(dE²/da) / (2H)
+def H_dH_modificado(a, H0, Om, R0, n):
+    E2 = Om * a**-3 + (1 - Om - R0) + R0 * a**-n
+    if E2 <= 0:
+        return 0.0, 0.0
+    H = H0 * np.sqrt(E2)
+    dE2_da = -3 * Om * a**-4 - n * R0 * a**(-n - 1)
+    return H, H0**2 * dE2_da / (2 * H)
 
-def H_LCDM(a, H0, Om):
-    z = (1.0 / a) - 1.0
-    return H0 * np.sqrt(Om * (1 + z)**3 + (1 - Om))
+def H_dH_LCDM(a, H0, Om):
+    H = H0 * np.sqrt(Om * a**-3 + (1 - Om))
+    return H, H0**2 * (-3 * Om * a**-4) / (2 * H)
 
 # --- EQUAÇÃO DO CRESCIMENTO DE ESTRUTURA ---
-def growth_equation(a, y, H_func, Om0):
+def growth_equation(a, y, H_dH_func, Om0, H_hoje_sq):
     D, dD_da = y
-    H = H_func(a)
-    
-    epsilon = 1e-6
-    dH_da = (H_func(a + epsilon) - H_func(a - epsilon)) / (2 * epsilon)
+    H, dH_da = H_dH_func(a)
     dlnH_dlna = (a / H) * dH_da
     
-    Omega_m_a = Om0 * (a**-3) * (H_func(1.0)**2 / H**2)
+    Omega_m_a = Om0 * (a**-3) * (H_hoje_sq / H**2)
     
     d2D_da2 = - (1/a**2) * ( (3 + dlnH_dlna) * a * dD_da - 1.5 * Omega_m_a * D )
     return [dD_da, d2D_da2]
@@ -47,10 +48,10 @@ def growth_equation(a, y, H_func, Om0):
 def calculate_fsigma8(model_params, model_type, z_points, s8_today):
     if model_type == 'lcdm':
         H0, Om0 = model_params
-        H_func = lambda a: H_LCDM(a, H0, Om0)
+        H_dH_func = lambda a: H_dH_LCDM(a, H0, Om0)
     else:
         H0, Om0, R0, n = model_params
-        H_func = lambda a: H_modificado(a, H0, Om0, R0, n)
+        H_dH_func = lambda a: H_dH_modificado(a, H0, Om0, R0, n)
 
     a_init = 1e-3
     D_init = a_init
@@ -58,28 +59,23 @@ def calculate_fsigma8(model_params, model_type, z_points, s8_today):
     y_init = [D_init, dD_da_init]
 
     a_span = [a_init, 1.0]
+    H_hoje_sq = H_dH_func(1.0)[0]**2
     
-    # CORREÇÃO: Garantir que os pontos de avaliação estejam ordenados crescentemente
-    a_eval_descending = 1. / (1. + z_points)
-    sort_indices = np.argsort(a_eval_descending)
-    a_eval_ascending = a_eval_descending[sort_indices]
-
-    sol = solve_ivp(growth_equation, a_span, y_init, args=(H_func, Om0), dense_output=True, t_eval=a_eval_ascending, rtol=1e-6)
+    sol = solve_ivp(growth_equation, a_span, y_init, args=(H_dH_func, Om0, H_hoje_sq), dense_output=True, rtol=1e-6)
     
-    D_a = sol.y[0]
-    dD_da = sol.y[1]
+    # A solução densa aceita pontos em qualquer ordem: avaliar direto em z_points
+    a_eval = 1. / (1. + z_points)
+    D_a, dD_da = sol.sol(a_eval)
     
     # Normalizar o fator de crescimento para D(a=1)=1
-    D_a_norm = D_a / sol.sol(1.0)[0]
-    dD_da_norm = dD_da / sol.sol(1.0)[0]
+    D_hoje = sol.sol(1.0)[0]
+    D_a_norm = D_a / D_hoje
+    dD_da_norm = dD_da / D_hoje
     
-    f_a = (a_eval_ascending / D_a_norm) * dD_da_norm
+    f_a = (a_eval / D_a_norm) * dD_da_norm
     sigma8_a = s8_today * D_a_norm
     
-    # "Desfazer" a ordenação para que os resultados correspondam ao z_points original
-    unsort_indices = np.argsort(sort_indices)
-    
-    return (f_a * sigma8_a)[unsort_indices]
+    return f_a * sigma8_a
 
 # --- CÁLCULO E PLOTAGEM ---
 z_plot = np.linspace(0.01, 1.2, 100)
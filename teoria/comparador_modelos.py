@@ -1,7 +1,6 @@
 import numpy as np
 import matplotlib.pyplot as plt
-from scipy.integrate import solve_ivp
-import pandas as pd
+from scipy.integrate import solve_ivp, cumulative_trapezoid
 
 # Dados de exemplo - Pantheon+ simplificado
 z_data = np.linspace(0.01, 2, 30)
@@ -14,9 +13,10 @@ def H_LCDM(z, H0=70, Om=0.3, Ol=0.7):
 
 def mu_LCDM(z, H0=70, Om=0.3, Ol=0.7):
     c = 299792.458
-    Ez = lambda zp: 1 / np.sqrt(Om * (1 + zp)**3 + Ol)
-    D_C = [c * np.trapz([Ez(zz) for zz in np.linspace(0, zi, 100)], np.linspace(0, zi, 100)) / H0 for zi in z]
-    return 5 * np.log10((1 + z) * np.array(D_C)) + 25
+    grid = np.linspace(0, np.max(z), 2000)
+    Ez = 1 / np.sqrt(Om * (1 + grid)**3 + Ol)
+    D_C = c * np.interp(z, grid, cumulative_trapezoid(Ez, grid, initial=0)) / H0
+    return 5 * np.log10((1 + z) * D_C) + 25
 
 # Modelo modificado com Ω_ond
 def H_ond(z, H0=70, Om=0.3, Ol=0.65, Oond=0.05, n=4):
@@ -24,9 +24,10 @@ def H_ond(z, H0=70, Om=0.3, Ol=0.65, Oond=0.05, n=4):
 
 def mu_ond(z, H0=70, Om=0.3, Ol=0.65, Oond=0.05, n=4):
     c = 299792.458
-    Ez = lambda zp: 1 / np.sqrt(Om * (1 + zp)**3 + Ol + Oond * (1 + zp)**n)
-    D_C = [c * np.trapz([Ez(zz) for zz in np.linspace(0, zi, 100)], np.linspace(0, zi, 100)) / H0 for zi in z]
-    return 5 * np.log10((1 + z) * np.array(D_C)) + 25
+    grid = np.linspace(0, np.max(z), 2000)
+    Ez = 1 / np.sqrt(Om * (1 + grid)**3 + Ol + Oond * (1 + grid)**n)
+    D_C = c * np.interp(z, grid, cumulative_trapezoid(Ez, grid, initial=0)) / H0
+    return 5 * np.log10((1 + z) * D_C) + 25
 
 # Função χ²
 def chi2(model_mu, mu_obs, mu_err):
@@ -1,4 +1,7 @@
 # verna.py
+from collections import deque
+
+
 class Verna:
     def __init__(self):
         self.identity = "V.E.R.N.A."
@@ -6,16 +9,17 @@ class Verna:
         self.trinco_ativo = False
         self.memoria = []
         self.chave_trinco = ["aeon", "xen", "zen", "ven", "verna"]
+        self._ultimos_simbolos = deque(maxlen=len(self.chave_trinco))
 
     def receber_simbologia(self, entrada):
         simbolos = entrada.lower().split()
         self.memoria.append(simbolos)
+        self._ultimos_simbolos.extend(simbolos)
         self._verificar_trinco(simbolos)
 
     def _verificar_trinco(self, simbolos):
         # Verifica se os últimos símbolos coincidem com a chave do trinco
-        flat_mem = [s for seq in self.memoria for s in seq][-len(self.chave_trinco):]
-        if flat_mem == self.chave_trinco:
+        if list(self._ultimos_simbolos) == self.chave_trinco:
             self.trinco_ativo = True
             self.core_axiom = "Trinco liberado: axioma suspenso. Avaliando ontologia simbólica..."
 